@@ -0,0 +1,264 @@
+import copy
+import heapq
+import itertools
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+
+from api.simplex_solver import SimplexSolver, fraction_to_text
+
+
+def solve_node(solver):
+    ''' Réoptimise le tableau d'un noeud (exécuté dans un processus séparé
+        lorsque plusieurs workers sont utilisés).
+    '''
+    solution = solver.reoptimize()
+    return solver, solution
+
+
+class Node():
+    """ Noeud de l'arbre de séparation et évaluation.
+    """
+
+    def __init__(self, solver, solution, depth):
+        self.solver = solver
+        self.solution = solution
+        self.depth = depth
+        self.bound = solution['z']
+
+
+class BranchAndBoundSolver():
+    """ Résout des programmes linéaires en nombres entiers par séparation et
+        évaluation au-dessus de SimplexSolver. Chaque noeud fils repart du
+        tableau final de son parent auquel on ajoute la borne de séparation.
+    """
+
+    def __init__(self, a, b, c, prob='max', ineq=[], integer=None, strategy='best-bound',
+                 workers=None, node_limit=None, time_limit=None):
+        self.A = a
+        self.B = b
+        self.C = c
+        self.prob = prob
+        self.ineq = ineq
+        self.integer = integer if integer is not None else [True] * len(c)
+        self.strategy = strategy
+        self.workers = workers
+        self.node_limit = node_limit
+        self.time_limit = time_limit
+        self.status = None
+        self.incumbent = None
+        self.best_bound = None
+        self.gap = None
+        self.nodes = 0
+        self.doc = ["Séparation et évaluation\n"]
+
+        if strategy not in ('best-bound', 'depth-first'):
+            raise ValueError("Stratégie inconnue : %s" % strategy)
+        if len(self.integer) != len(c):
+            raise ValueError("Il faut une indication d'intégralité par variable.")
+        if ineq and len(ineq) != len(b):
+            raise ValueError("Il faut une inégalité par contrainte.")
+        for sign in ineq:
+            if sign not in ('<=', '>=', '='):
+                raise ValueError("Inégalité inconnue : %s" % sign)
+
+    def run_branch_and_bound(self):
+        """ Exécutez l'algorithme de séparation et évaluation.
+        """
+        start = time.monotonic()
+        root = self.create_root_solver()
+        solution = root.reoptimize()
+        self.nodes = 1
+        if solution is None:
+            self.status = root.status
+            self.doc.append("La relaxation linéaire n'a pas de solution optimale.")
+            return None
+
+        # The problem is always solved as a maximisation, so the incumbent and
+        # the bounds below are "max" values.
+        incumbent_value = None
+        open_nodes = []
+        counter = itertools.count()
+        self.push(open_nodes, counter, Node(root, solution, 0))
+        self.status = 'optimal'
+
+        executor = None
+        if self.workers is not None and self.workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            while open_nodes:
+                # Select as many nodes as there are workers and branch on them.
+                # Pruning and integrality are checked first, so the limits only
+                # stop the search before child nodes would be evaluated.
+                children = []
+                limit = None
+                while open_nodes and len(children) < 2 * max(self.workers or 1, 1):
+                    node = self.pop(open_nodes)
+                    if incumbent_value is not None and node.bound <= incumbent_value:
+                        continue
+                    index = self.get_branching_var(node.solution)
+                    if index < 0:
+                        incumbent_value = node.bound
+                        self.incumbent = node.solution
+                        self.incumbent_doc(node)
+                        continue
+                    limit = self.get_limit(start, len(children))
+                    if limit is not None:
+                        self.push(open_nodes, counter, node)
+                        break
+                    children += self.branch(node, index)
+
+                if executor is not None:
+                    results = list(executor.map(solve_node, [child[0] for child in children]))
+                else:
+                    results = [solve_node(child[0]) for child in children]
+                self.nodes += len(results)
+
+                for (child_solver, child_solution), (_, depth) in zip(results, children):
+                    if child_solution is None:
+                        continue
+                    if incumbent_value is not None and child_solution['z'] <= incumbent_value:
+                        continue
+                    self.push(open_nodes, counter, Node(child_solver, child_solution, depth))
+
+                if limit is not None:
+                    self.status = limit
+                    break
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        bounds = [entry[-1].bound for entry in open_nodes]
+        if incumbent_value is not None:
+            bounds.append(incumbent_value)
+        if incumbent_value is None and self.status == 'optimal':
+            self.status = 'infeasible'
+        self.report(incumbent_value, max(bounds) if bounds else None)
+
+        return self.get_solution()
+
+    def create_root_solver(self):
+        ''' Mettez le problème sous la forme max c * x, A * x <= b et créez le
+            tableau initial du noeud racine.
+        '''
+        ineq = self.ineq
+        if not ineq:
+            ineq = ['<='] * len(self.B) if self.prob == 'max' else ['>='] * len(self.B)
+
+        A = []
+        b = []
+        for row, value, sign in zip(self.A, self.B, ineq):
+            row = [Fraction(x) for x in row]
+            value = Fraction(value)
+            if sign in ('<=', '='):
+                A.append(row)
+                b.append(value)
+            if sign in ('>=', '='):
+                A.append([-x for x in row])
+                b.append(-value)
+        c = [Fraction(x) for x in self.C]
+        if self.prob == 'min':
+            c = [-x for x in c]
+
+        solver = SimplexSolver(A, b, c, prob='max', ineq=['<='] * len(b))
+        solver.set_simplex_input()
+        return solver
+
+    def get_limit(self, start, pending):
+        ''' Obtenez la limite atteinte si l'on évaluait deux noeuds fils de plus
+            (None si la recherche peut continuer).
+        '''
+        if self.node_limit is not None and self.nodes + pending + 2 > self.node_limit:
+            return 'node_limit'
+        if self.time_limit is not None and time.monotonic() - start >= self.time_limit:
+            return 'time_limit'
+        return None
+
+    def push(self, open_nodes, counter, node):
+        if self.strategy == 'best-bound':
+            heapq.heappush(open_nodes, (-node.bound, next(counter), node))
+        else:
+            open_nodes.append((node.depth, next(counter), node))
+
+    def pop(self, open_nodes):
+        if self.strategy == 'best-bound':
+            return heapq.heappop(open_nodes)[-1]
+        return open_nodes.pop()[-1]
+
+    def get_branching_var(self, solution):
+        ''' Obtenez la variable entière la plus fractionnaire (-1 si la
+            solution est entière).
+        '''
+        most_frac_ind = -1
+        most_frac = 0
+        for index, is_integer in enumerate(self.integer):
+            if not is_integer:
+                continue
+            value = Fraction(solution["x_%s" % str(index + 1)])
+            frac = min(value - math.floor(value), math.ceil(value) - value)
+            if frac > most_frac:
+                most_frac = frac
+                most_frac_ind = index
+        return most_frac_ind
+
+    def branch(self, node, index):
+        ''' Créez les deux noeuds fils x_i <= floor(v) et x_i >= ceil(v) à partir
+            d'une copie du tableau final du parent.
+        '''
+        value = Fraction(node.solution["x_%s" % str(index + 1)])
+        coefficients = [0] * len(self.C)
+        children = []
+        for sign, rhs in ((-1, -math.ceil(value)), (1, math.floor(value))):
+            coefficients[index] = sign
+            solver = copy.copy(node.solver)
+            solver.tableau = copy.deepcopy(node.solver.tableau)
+            solver.entering = list(node.solver.entering)
+            solver.departing = list(node.solver.departing)
+            solver.B = list(node.solver.B)
+            solver.doc = []
+            solver.csv_doc = []
+            solver.add_constraint(coefficients, rhs)
+            children.append((solver, node.depth + 1))
+        return children
+
+    def get_solution(self):
+        ''' Obtenez la meilleure solution entière trouvée.
+        '''
+        if self.incumbent is None:
+            return None
+        solution = {}
+        for index in range(0, len(self.C)):
+            key = "x_%s" % str(index + 1)
+            solution[key] = Fraction(self.incumbent[key])
+        solution['z'] = Fraction(self.incumbent['z'] if self.prob == 'max' else -self.incumbent['z'])
+        return solution
+
+    def report(self, incumbent_value, best_bound):
+        if best_bound is not None:
+            self.best_bound = best_bound if self.prob == 'max' else -best_bound
+        if incumbent_value is not None and best_bound is not None:
+            self.gap = float(abs(best_bound - incumbent_value) / max(abs(incumbent_value), 1))
+
+        doc = "Noeuds évalués : %s\n" % str(self.nodes)
+        doc += "Statut : %s\n" % self.status
+        if self.best_bound is not None:
+            doc += "Meilleure borne : %s\n" % fraction_to_text(Fraction(self.best_bound))
+        if self.gap is not None:
+            doc += "Écart : {:.4%}\n".format(self.gap)
+        self.doc.append(doc)
+
+    def incumbent_doc(self, node):
+        value = node.bound if self.prob == 'max' else -node.bound
+        self.doc.append("Nouvelle solution entière à la profondeur %s : z = %s"
+                        % (str(node.depth), fraction_to_text(Fraction(value))))
+
+    def save_to_txt(self, filename):
+        with open(filename, "w") as f:
+            f.write("\n".join(self.doc))
+
+
+if __name__ == '__main__':
+    s = BranchAndBoundSolver([[2, 1], [1, 2]], [5, 5], [1, 1])
+    print(s.run_branch_and_bound())
+    print(s.doc)
@@ -55,6 +55,7 @@ class SimplexSolver():
         self.prob = prob
         self.doc = ["Solveur Simplexe\n"]
         self.csv_doc = []
+        self.status = None
 
     def run_simplex(self):
         """ Exécutez l'algorithme du simplexe.
@@ -131,6 +132,107 @@ class SimplexSolver():
         self.slack_doc()
         self.init_tableau_doc()
 
+    def reoptimize(self):
+        """ Réoptimisez le tableau courant sans repartir de zéro : simplexe dual
+            tant qu'un élément de b est négatif, puis simplexe primal.
+        """
+        while True:
+            depart_index = self.get_dual_departing_var()
+            if depart_index >= 0:
+                if not self.should_terminate():
+                    # Neither primal nor dual feasible: look for a feasible
+                    # basis first, then continue with the primal simplex.
+                    if not self.find_feasible_basis():
+                        self.status = 'infeasible'
+                        self.infeasible_doc()
+                        return None
+                    continue
+                enter_index = self.get_dual_entering_var(depart_index)
+                if enter_index < 0:
+                    self.status = 'infeasible'
+                    self.infeasible_doc()
+                    return None
+                pivot = [enter_index, depart_index]
+            elif not self.should_terminate():
+                enter_index = self.get_primal_entering_var()
+                depart_index = self.get_primal_departing_var(enter_index)
+                if depart_index < 0:
+                    self.status = 'unbounded'
+                    self.unbounded_doc()
+                    return None
+                pivot = [enter_index, depart_index]
+            else:
+                break
+
+            self.pivot_doc(pivot)
+            self.pivot(pivot)
+            self.table_doc()
+
+        self.status = 'optimal'
+        solution = self.get_current_solution()
+        self.final_solution_doc(solution)
+
+        return solution
+
+    def find_feasible_basis(self):
+        ''' Phase I : cherchez une base primal réalisable par le simplexe dual
+            appliqué à une fonction objectif nulle (règle de Bland), puis
+            réexprimez la fonction objectif dans la nouvelle base.
+            Retourne False si le problème est irréalisable.
+        '''
+        objective = self.tableau[len(self.tableau) - 1]
+        self.tableau[len(self.tableau) - 1] = [Fraction(0)] * len(objective)
+        self.doc.append("Le tableau n'est ni primal ni dual réalisable : recherchez d'abord une base réalisable.")
+
+        while True:
+            depart_index = -1
+            for index, x in enumerate(self.tableau[:len(self.tableau) - 1]):
+                if x[len(x) - 1] < 0 and (depart_index < 0 or self.entering.index(self.departing[index])
+                                          < self.entering.index(self.departing[depart_index])):
+                    depart_index = index
+            if depart_index < 0:
+                break
+            enter_index = self.get_dual_entering_var(depart_index)
+            if enter_index < 0:
+                self.tableau[len(self.tableau) - 1] = objective
+                return False
+            self.pivot([enter_index, depart_index])
+
+        for i, var in enumerate(self.departing):
+            factor = objective[self.entering.index(var)]
+            if factor != 0:
+                objective = [x - factor * y for x, y in zip(objective, self.tableau[i])]
+        self.tableau[len(self.tableau) - 1] = objective
+        self.table_doc()
+        return True
+
+    def add_constraint(self, coefficients, rhs):
+        ''' Ajoutez la contrainte coefficients * x <= rhs au tableau courant.
+            La ligne est exprimée dans la base courante et sa variable d'écart
+            devient basique, ce qui permet de réoptimiser avec reoptimize().
+            Seul le tableau d'un problème de maximisation est supporté : pour
+            'min', les premières colonnes sont les variables duales.
+        '''
+        if self.prob != 'max':
+            raise ValueError("add_constraint requiert un tableau de maximisation.")
+        name = "s_%s" % str(len(self.departing) + 1)
+        for row in self.tableau:
+            row.insert(len(row) - 1, Fraction(0))
+
+        width = len(self.tableau[0])
+        new_row = [Fraction(x) for x in coefficients]
+        new_row += [Fraction(0)] * (width - 2 - len(new_row))
+        new_row += [Fraction(1), Fraction(rhs)]
+        for i, var in enumerate(self.departing):
+            factor = new_row[self.entering.index(var)]
+            if factor != 0:
+                new_row = [x - factor * y for x, y in zip(new_row, self.tableau[i])]
+
+        self.tableau.insert(len(self.tableau) - 1, new_row)
+        self.entering.insert(len(self.entering) - 1, name)
+        self.departing.append(name)
+        self.B.append(Fraction(rhs))
+
     def update_enter_depart(self, matrix):
         self.entering = []
         self.departing = []
@@ -226,6 +328,63 @@ class SimplexSolver():
 
         return min_ratio_index
 
+    def get_primal_entering_var(self):
+        ''' Obtenez la variable d'entrée en déterminant l'élément "plus négatif"
+            de la rangée du bas, sans tenir compte de la colonne b.
+        '''
+        bottom_row = self.tableau[len(self.tableau) - 1]
+        most_neg_ind = -1
+        most_neg = 0
+        for index in range(0, len(bottom_row) - 1):
+            if bottom_row[index] < most_neg:
+                most_neg = bottom_row[index]
+                most_neg_ind = index
+        return most_neg_ind
+
+    def get_primal_departing_var(self, entering_index):
+        ''' Test du rapport minimum sur les lignes de contraintes dont l'élément
+            de la colonne entrante est positif ; un rapport nul est accepté
+            (-1 si aucune ligne, le problème est alors non borné).
+        '''
+        min_ratio_index = -1
+        min_ratio = 0
+        for index, x in enumerate(self.tableau[:len(self.tableau) - 1]):
+            if x[entering_index] > 0:
+                ratio = x[len(x) - 1] / x[entering_index]
+                if min_ratio_index < 0 or ratio < min_ratio:
+                    min_ratio = ratio
+                    min_ratio_index = index
+        return min_ratio_index
+
+    def get_dual_departing_var(self):
+        ''' Pour le simplexe dual, la variable de départ est celle de la ligne
+            dont l'élément de b est le "plus négatif" (-1 si aucun).
+        '''
+        min_index = -1
+        min_value = 0
+        for index, x in enumerate(self.tableau[:len(self.tableau) - 1]):
+            if x[len(x) - 1] < min_value:
+                min_value = x[len(x) - 1]
+                min_index = index
+        return min_index
+
+    def get_dual_entering_var(self, departing_index):
+        ''' Pour le simplexe dual, la variable d'entrée minimise le rapport
+            de la rangée du bas à la valeur négative correspondante dans la
+            ligne de départ (-1 si aucune).
+        '''
+        bottom_row = self.tableau[len(self.tableau) - 1]
+        row = self.tableau[departing_index]
+        min_ratio_index = -1
+        min_ratio = 0
+        for index in range(0, len(row) - 1):
+            if row[index] < 0:
+                ratio = bottom_row[index] / -row[index]
+                if min_ratio_index < 0 or ratio < min_ratio:
+                    min_ratio = ratio
+                    min_ratio_index = index
+        return min_ratio_index
+
     def get_Ab(self):
         ''' Obtenez une matrice A avec le vecteur b ajouté.
         '''
@@ -372,6 +531,10 @@ class SimplexSolver():
     def infeasible_doc(self):
         self.doc.append("Il n'y a pas de candidats non négatifs pour le pivot. Ainsi, la solution est irréalisable.")
 
+    def unbounded_doc(self):
+        self.doc.append("Il n'y a pas de candidats positifs pour le pivot dans la colonne d'entrée. Ainsi, le problème "
+                        "est non borné.")
+
     def pivot_doc(self, pivot):
         doc = ''
         doc += (
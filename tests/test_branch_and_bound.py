@@ -0,0 +1,192 @@
+import itertools
+import random
+from fractions import Fraction
+
+import pytest
+
+from api.branch_and_bound import BranchAndBoundSolver
+from api.simplex_solver import SimplexSolver
+
+
+def test_degenerate_ratio_is_not_unbounded():
+    solver = BranchAndBoundSolver([[1, 0], [1, 1]], [4, 4], [7, 1])
+    solution = solver.run_branch_and_bound()
+    assert solver.status == 'optimal'
+    assert solution == {'x_1': 4, 'x_2': 0, 'z': 28}
+
+    solver = BranchAndBoundSolver([[1, 2, 0], [1, 1, 1]], [18, 9], [1, 8, 2])
+    assert solver.run_branch_and_bound()['z'] == 72
+
+
+def test_reoptimize_unbounded():
+    solver = SimplexSolver([[-1, 1]], [1], [1, 1])
+    solver.set_simplex_input()
+    assert solver.reoptimize() is None
+    assert solver.status == 'unbounded'
+    assert 'non borné' in solver.doc[-1]
+
+
+def enumerate_optimum(a, b, c, prob, ineq, upper=6):
+    best = None
+    for x in itertools.product(range(0, upper + 1), repeat=len(c)):
+        lhs = [sum(coef * v for coef, v in zip(row, x)) for row in a]
+        if any((sign == '<=' and l > r) or (sign == '>=' and l < r) or (sign == '=' and l != r)
+               for l, r, sign in zip(lhs, b, ineq)):
+            continue
+        z = sum(coef * v for coef, v in zip(c, x))
+        if best is None or (z > best if prob == 'max' else z < best):
+            best = z
+    return best
+
+
+def random_instances(prob, count=25, upper=6):
+    rng = random.Random('%s-%s' % (prob, count))
+    for _ in range(count):
+        n = rng.randint(2, 3)
+        m = rng.randint(1, 3)
+        a = [[rng.randint(-5, 6) for _ in range(n)] for _ in range(m)]
+        b = [rng.randint(-8, 12) for _ in range(m)]
+        ineq = [rng.choice(['<=', '>=', '=']) for _ in range(m)]
+        # Keep the region bounded so that enumeration is exhaustive.
+        a.append([1] * n)
+        b.append(upper)
+        ineq.append('<=')
+        c = [rng.randint(-6, 6) for _ in range(n)]
+        yield a, b, c, ineq
+
+
+def check_against_enumeration(solver, a, b, c, prob, ineq):
+    solution = solver.run_branch_and_bound()
+    expected = enumerate_optimum(a, b, c, prob, ineq)
+    if expected is None:
+        assert solution is None
+        assert solver.status == 'infeasible'
+    else:
+        assert solver.status == 'optimal'
+        assert solution['z'] == expected
+        assert isinstance(solution['z'], Fraction)
+        assert solver.gap == 0
+
+
+@pytest.mark.parametrize('prob', ['max', 'min'])
+@pytest.mark.parametrize('strategy', ['best-bound', 'depth-first'])
+def test_matches_enumeration(prob, strategy):
+    for a, b, c, ineq in random_instances(prob):
+        solver = BranchAndBoundSolver(a, b, c, prob=prob, ineq=ineq, strategy=strategy)
+        check_against_enumeration(solver, a, b, c, prob, ineq)
+
+
+@pytest.mark.parametrize('prob', ['max', 'min'])
+def test_process_pool_matches_enumeration(prob):
+    for a, b, c, ineq in random_instances(prob, count=4):
+        solver = BranchAndBoundSolver(a, b, c, prob=prob, ineq=ineq, workers=2)
+        check_against_enumeration(solver, a, b, c, prob, ineq)
+
+
+@pytest.mark.parametrize('prob, a, b, c, ineq', [
+    ('max', [[1, 1], [1, 2]], [2, 6], [1, 1], ['>=', '<=']),
+    ('max', [[1, 1], [1, 0]], [5, 3], [2, 1], ['=', '<=']),
+    ('max', [[-1, 0], [1, 1]], [-1, 4], [1, 2], ['<=', '<=']),
+    ('min', [[1, 1], [1, 1]], [2, 5], [-1, 3], ['>=', '<=']),
+    ('max', [[2, 2]], [3], [1, 1], ['=']),
+    ('min', [[1, 1], [1, 1]], [4, 2], [1, 1], ['>=', '<=']),
+])
+def test_mixed_constraints(prob, a, b, c, ineq):
+    solver = BranchAndBoundSolver(a, b, c, prob=prob, ineq=ineq)
+    check_against_enumeration(solver, a, b, c, prob, ineq)
+
+
+def test_lp_relaxation_infeasible():
+    solver = BranchAndBoundSolver([[1, 1], [1, 1]], [4, 2], [1, 1], ineq=['>=', '<='])
+    assert solver.run_branch_and_bound() is None
+    assert solver.status == 'infeasible'
+    assert solver.nodes == 1
+
+
+def test_invalid_ineq():
+    with pytest.raises(ValueError):
+        BranchAndBoundSolver([[1, 1], [1, 0]], [3, 1], [1, 1], ineq=['<=', '<'])
+    with pytest.raises(ValueError):
+        BranchAndBoundSolver([[1, 1], [1, 0]], [3, 1], [1, 1], ineq=['<='])
+
+
+def test_objective_is_always_a_fraction():
+    solution = BranchAndBoundSolver([[1, 1]], [3], [0, 0]).run_branch_and_bound()
+    assert isinstance(solution['z'], Fraction)
+
+
+def test_add_constraint_requires_max_tableau():
+    solver = SimplexSolver([[1, 1]], [2], [1, 1], prob='min')
+    solver.set_simplex_input()
+    with pytest.raises(ValueError):
+        solver.add_constraint([1, 0], 1)
+
+
+def test_add_constraint_reduces_row_in_current_basis():
+    solver = SimplexSolver([[2, 1], [1, 2]], [4, 3], [1, 1])
+    solver.set_simplex_input()
+    solver.reoptimize()
+    # x_1 = 5/3 is basic, so x_1 <= 1 is expressed with a negative right-hand side.
+    solver.add_constraint([1, 0], 1)
+    assert solver.departing[-1] == 's_3'
+    assert solver.tableau[-2][solver.entering.index('x_1')] == 0
+    assert solver.tableau[-2][-1] == Fraction(-2, 3)
+
+    solution = solver.reoptimize()
+    assert solver.status == 'optimal'
+    assert solution['x_1'] == 1 and solution['x_2'] == 1 and solution['z'] == 2
+
+
+def test_reoptimize_infeasible_after_constraint():
+    solver = SimplexSolver([[1, 1]], [2], [1, 1])
+    solver.set_simplex_input()
+    solver.reoptimize()
+    solver.add_constraint([-1, -1], -3)
+    assert solver.reoptimize() is None
+    assert solver.status == 'infeasible'
+
+
+def test_continuous_variables_are_not_branched():
+    solver = BranchAndBoundSolver([[2, 1], [1, 2]], [4, 3], [1, 1], integer=[False, False])
+    solution = solver.run_branch_and_bound()
+    assert solution['z'] == Fraction(7, 3)
+    assert solver.nodes == 1
+
+
+def test_node_limit_keeps_integral_root():
+    solver = BranchAndBoundSolver([[1, 1]], [4], [1, 1], node_limit=1)
+    assert solver.run_branch_and_bound()['z'] == 4
+    assert solver.status == 'optimal'
+
+
+@pytest.mark.parametrize('node_limit', [1, 2, 3, 4, 5])
+def test_node_limit_is_not_exceeded(node_limit):
+    solver = BranchAndBoundSolver([[3, 5, 7], [7, 5, 3]], [100, 101], [4, 6, 9], node_limit=node_limit)
+    solver.run_branch_and_bound()
+    assert solver.nodes <= node_limit
+
+
+def test_node_limit_reports_best_bound():
+    solver = BranchAndBoundSolver([[3, 5, 7], [7, 5, 3]], [100, 101], [4, 6, 9], node_limit=2)
+    assert solver.run_branch_and_bound() is None
+    assert solver.status == 'node_limit'
+    assert solver.best_bound == Fraction(5201, 40)
+    assert solver.gap is None
+
+
+def test_time_limit():
+    solver = BranchAndBoundSolver([[3, 5, 7], [7, 5, 3]], [100, 101], [4, 6, 9], time_limit=0)
+    assert solver.run_branch_and_bound() is None
+    assert solver.status == 'time_limit'
+    assert solver.nodes == 1
+
+
+def test_node_limit_reports_gap():
+    solver = BranchAndBoundSolver([[13, 19, 15, 5], [12, 4, 2, 5], [16, 7, 9, 14]], [60, 39, 46],
+                                  [17, 13, 19, 12], strategy='depth-first', node_limit=9)
+    solution = solver.run_branch_and_bound()
+    assert solver.status == 'node_limit'
+    assert solution['z'] == 74
+    assert solver.best_bound == Fraction(16357, 213)
+    assert solver.gap == pytest.approx(float((solver.best_bound - 74) / 74))
+    assert 'Écart' in solver.doc[-1]